@@ -1,12 +1,39 @@
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.middleware.gzip import GZipMiddleware
 import uvicorn
 
+try:
+    import uvloop  # noqa: F401
+    _LOOP = "uvloop"
+except ImportError:
+    _LOOP = "auto"
+
+try:
+    import httptools  # noqa: F401
+    _HTTP = "httptools"
+except ImportError:
+    _HTTP = "auto"
+
+logger = logging.getLogger("smart_app.device")
+
+
+def _server_config(app: FastAPI, host: str, port: int) -> uvicorn.Config:
+    return uvicorn.Config(
+        app, host=host, port=port,
+        loop=_LOOP, http=_HTTP, log_level="warning", access_log=False
+    )
+
+
 class DeviceInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     device_id: str
     device_type: str
     host: str
@@ -28,33 +55,38 @@ class BaseDevice(ABC):
         self.device_type: str = device_type
         self.host: str = host
         self.port: int = port
-        self.base_url: str = f"http://{host}: {port}"
+        self.base_url: str = f"http://{host}:{port}"
         self.api_base: str = f"/api/{device_type}"
         self.app: FastAPI = FastAPI(
             title=f"{device_type.title()} - {device_id}",
             description=f"Microservice for {self.device_type} device",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
+        self.app.add_middleware(GZipMiddleware, minimum_size=1000)
 
     @abstractmethod
     def get_status(self) -> Dict[str, Any]:
         ...
 
     @abstractmethod
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Sequence[str]:
         ...
 
     def register(self, controller):
         try:
             _ = controller.register_device(self)
-            print(f"Device {self.device_id} registered successfully with controller")
+            logger.info(f"Device {self.device_id} registered successfully with controller")
         except Exception as e:
-            print(f"Failed to register device {self.device_id} with controller: {e}")
+            logger.error(f"Failed to register device {self.device_id} with controller: {e}")
             raise
 
     def run_server(self):
-        print(f"Starting server of {self.device_type} on {self.host}: {self.port}")
-        uvicorn.run(
-            self.app, host=self.host, port=self.port, log_level="info"
-        )
+        """Serve the device API in a single process.
 
+        Device state lives in this process's memory, so the API is not spread
+        over several uvicorn workers: each would answer from its own copy of
+        the state.
+        """
+        logger.info(f"Starting server of {self.device_type} on {self.host}:{self.port}")
+        uvicorn.Server(_server_config(self.app, self.host, self.port)).run()
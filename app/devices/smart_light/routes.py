@@ -1,84 +1,88 @@
-from fastapi import APIRouter, HTTPException, Depends, Request
-from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Annotated, Literal
 
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+import orjson
 
-router = APIRouter(prefix="/api/light", tags=["light"])
 
-
-class LightSettingsUpdate(BaseModel):
-    is_on: bool
-    brightness: int
-    color_temperature: int
-    mode: str
-
-
-def get_device(request: Request):
-    return request.app.state.device
-
-
-@router.get("/status", response_model=Dict[str, Any])
-async def get_status(device = Depends(get_device)):
-    """Returns the current state and settings of the light."""
-    return device.get_status()
-
-
-# Add more endpoints for completeness
-@router.post("/power")
-async def set_power(is_on: bool, device = Depends(get_device)):
-    """Turn the light on or off."""
-    device.state.is_on = is_on
-    return {"status": "success", "is_on": is_on}
+# The power endpoint only ever answers with one of these two bodies
+_POWER_OK = {
+    is_on: orjson.dumps({"status": "success", "is_on": is_on})
+    for is_on in (True, False)
+}
 
 
-@router.post("/brightness")
-async def set_brightness(brightness: int, device = Depends(get_device)):
-    """Set brightness level (0-100)."""
-    if not 0 <= brightness <= 100:
-        raise HTTPException(status_code=400, detail="Brightness must be between 0 and 100")
-    device.state.brightness = brightness
-    return {"status": "success", "brightness": brightness}
+# Supported light modes; SmartLightDevice.available_modes is derived from this
+LightMode = Literal["eco", "night", "normal", "party"]
 
 
-@router.post("/temperature")
-async def set_temperature(temperature: int, device = Depends(get_device)):
-    """Set color temperature."""
-    if not device.min_temperature <= temperature <= device.max_temperature:
-        raise HTTPException(status_code=400,
-                            detail=f"Temperature must be between {device.min_temperature} and {device.max_temperature}")
-    device.state.color_temperature = temperature
-    return {"status": "success", "temperature": temperature}
-
-
-@router.post("/mode")
-async def set_mode(mode: str, device = Depends(get_device)):
-    """Set light mode."""
-    if mode not in device.available_modes:
-        raise HTTPException(status_code=400, detail=f"Mode must be one of: {', '.join(device.available_modes)}")
-    device.state.mode = mode
-    return {"status": "success", "mode": mode}
-
-
-@router.put("/settings")
-async def update_settings(settings: LightSettingsUpdate, device = Depends(get_device)):
-    """Update multiple settings at once."""
-    # Validate brightness
-    if not 0 <= settings.brightness <= 100:
-        raise HTTPException(status_code=400, detail="Brightness must be between 0 and 100")
-
-    # Validate temperature
-    if not device.min_temperature <= settings.color_temperature <= device.max_temperature:
-        raise HTTPException(status_code=400,
-                            detail=f"Temperature must be between {device.min_temperature} and {device.max_temperature}")
-
-    # Validate mode
-    if settings.mode not in device.available_modes:
-        raise HTTPException(status_code=400, detail=f"Mode must be one of: {', '.join(device.available_modes)}")
-
-    # Update all settings
-    device.state.is_on = settings.is_on
-    device.state.brightness = settings.brightness
-    device.state.color_temperature = settings.color_temperature
-    device.state.mode = settings.mode
+class LightSettingsUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
-    return {"status": "success", "settings": settings.model_dump()}
\ No newline at end of file
+    is_on: bool
+    brightness: Annotated[int, Field(ge=0, le=100)]
+    color_temperature: int
+    mode: LightMode
+
+
+def make_router(device) -> APIRouter:
+    """Builds the light API router bound directly to the given device."""
+    # Every input is range- and choice-checked by FastAPI while parsing, so
+    # invalid values get the same 422 response from every route
+    Brightness = Annotated[int, Query(ge=0, le=100)]
+    Temperature = Annotated[int, Query(ge=device.min_temperature, le=device.max_temperature)]
+
+    class DeviceSettingsUpdate(LightSettingsUpdate):
+        """Settings body limited to this device's temperature range."""
+        color_temperature: Annotated[
+            int, Field(ge=device.min_temperature, le=device.max_temperature)
+        ]
+
+    router = APIRouter(
+        prefix="/api/light", tags=["light"], default_response_class=ORJSONResponse
+    )
+
+    @router.get("/status")
+    async def get_status():
+        """Returns the current state and settings of the light."""
+        return Response(content=device.get_status_bytes(), media_type="application/json")
+
+    # Add more endpoints for completeness
+    @router.post("/power")
+    async def set_power(is_on: bool):
+        """Turn the light on or off."""
+        device.state.is_on = is_on
+        return Response(content=_POWER_OK[is_on], media_type="application/json")
+
+    @router.post("/brightness")
+    async def set_brightness(brightness: Brightness):
+        """Set brightness level (0-100)."""
+        device.state.brightness = brightness
+        return {"status": "success", "brightness": brightness}
+
+    @router.post("/temperature")
+    async def set_temperature(temperature: Temperature):
+        """Set color temperature."""
+        device.state.color_temperature = temperature
+        return {"status": "success", "temperature": temperature}
+
+    @router.post("/mode")
+    async def set_mode(mode: LightMode):
+        """Set light mode."""
+        device.state.mode = mode
+        return {"status": "success", "mode": mode}
+
+    @router.put("/settings")
+    async def update_settings(settings: DeviceSettingsUpdate):
+        """Update multiple settings at once."""
+        # Update all settings
+        state = device.state
+        state.is_on = settings.is_on
+        state.brightness = settings.brightness
+        state.color_temperature = settings.color_temperature
+        state.mode = settings.mode
+
+        return {"status": "success", "settings": settings.model_dump()}
+
+    return router
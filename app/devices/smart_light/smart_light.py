@@ -1,25 +1,43 @@
-from typing import Dict, Any, List
-from pydantic import BaseModel
+import logging
+from typing import Dict, Any, Optional, Tuple, get_args
+from pydantic import BaseModel, ConfigDict
+import orjson
 from app.devices.base_device import BaseDevice
-from app.devices.smart_light.routes import router as light_router
+from app.devices.smart_light.routes import LightMode, make_router
 
 
-class LightState(BaseModel):
-    is_on: bool = False
-    brightness: int = 100
-    color_temperature: int = 4000
-    mode: str = "eco"
+class LightState:
+    """Mutable in-process light state; request bodies are validated by the route models."""
+    __slots__ = ("is_on", "brightness", "color_temperature", "mode")
+
+    def __init__(
+            self,
+            is_on: bool = False,
+            brightness: int = 100,
+            color_temperature: int = 4000,
+            mode: str = "eco"
+    ) -> None:
+        self.is_on: bool = is_on
+        self.brightness: int = brightness
+        self.color_temperature: int = color_temperature
+        self.mode: str = mode
 
 
 class BrightnessRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     brightness: int
 
 
 class TemperatureRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     temperature: int
 
 
 class ModeRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mode: str
 
 
@@ -27,36 +45,56 @@ class SmartLightDevice(BaseDevice):
     def __init__(self, device_id: str = "light_default", host: str = "127.0.0.1", port: int = 8001):
         super().__init__(device_id, "light", host, port)
         self.state = LightState()
-        self.available_modes = ["eco", "night", "normal", "party"]
+        self.available_modes: Tuple[str, ...] = get_args(LightMode)
         self.min_temperature = 2000
         self.max_temperature = 8000
-        self.app.state.device = self
-
-        self.app.include_router(light_router)
+        # Encoded status and the state snapshot it was built from
+        self._status_key: Optional[Tuple[bool, int, int, str]] = None
+        self._status_bytes: bytes = b""
 
-    def get_status(self) -> Dict[str, Any]:
-        """Returns the complete status of the light, including current state and settings."""
-        return {
+        # Everything except the live state is fixed for the device's lifetime;
+        # the shared sequences are tuples so callers cannot mutate the device's data
+        self._status_template: Dict[str, Any] = {
             "device_id": self.device_id,
             "device_type": self.device_type,
-            "is_on": self.state.is_on,
-            "brightness": self.state.brightness,
-            "color_temperature": self.state.color_temperature,
-            "mode": self.state.mode,
             "available_modes": self.available_modes,
             "min_temperature": self.min_temperature,
             "max_temperature": self.max_temperature,
             "endpoint": f"{self.base_url}/api/light"
         }
-
-    def get_capabilities(self) -> List[str]:
-        return [
+        self._capabilities: Tuple[str, ...] = (
             "power_control", "brightness_control",
             "temperature_control", "mode_presets",
             "bulk_settings_update"
-        ]
+        )
+
+        self.app.include_router(make_router(self))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Returns the complete status of the light, including current state and settings."""
+        state = self.state
+        return {
+            **self._status_template,
+            "is_on": state.is_on,
+            "brightness": state.brightness,
+            "color_temperature": state.color_temperature,
+            "mode": state.mode
+        }
+
+    def get_status_bytes(self) -> bytes:
+        """Returns the JSON-encoded status, re-encoding only after the state has changed."""
+        state = self.state
+        key = (state.is_on, state.brightness, state.color_temperature, state.mode)
+        if key != self._status_key:
+            self._status_key = key
+            self._status_bytes = orjson.dumps(self.get_status())
+        return self._status_bytes
+
+    def get_capabilities(self) -> Tuple[str, ...]:
+        return self._capabilities
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     light = SmartLightDevice("kitchen light", "127.0.0.1", 8001)
     light.run_server()
\ No newline at end of file